@@ -11,6 +11,7 @@ setup(
     install_requires=[
         "appdirs",
         "boltons",
+        "lxml",
         "mementos",
         "numexpr",
         "numpy",
@@ -3,8 +3,10 @@ import datetime
 import functools
 import getpass
 import hashlib
+import logging
 import os
 import re
+import tempfile
 import time
 
 import appdirs
@@ -14,6 +16,8 @@ from pyquery import PyQuery as pq
 
 import sportsref
 
+logger = logging.getLogger(__name__)
+
 
 # TODO: move PSFConstants and GPFConstants to appdirs cache dir
 def switch_to_dir(dir_path):
@@ -90,6 +94,10 @@ def _days_valid_cfb(url):
 def cache(func):
     """Caches the HTML returned by the specified function `func`. Caches it in
     the user cache determined by the appdirs package.
+
+    `func` is called with the URL and a `modified_since` keyword argument,
+    which is the modification time of a stale cached copy (or None); it should
+    return None if the page hasn't changed since then.
     """
 
     CACHE_DIR = appdirs.user_cache_dir("sportsref", getpass.getuser())
@@ -110,8 +118,7 @@ def cache(func):
                 sport_id = a_sport_id
                 break
         else:
-            # TODO: log
-            print(f"No sport ID found for {url}, not able to check cache")
+            logger.warning("No sport ID found for %s, not able to check cache", url)
 
         # check whether cache is valid or stale
         file_exists = os.path.isfile(filename)
@@ -130,16 +137,55 @@ def cache(func):
         if file_exists and cache_is_valid and allow_caching:
             with open(filename, "r", encoding="utf-8", errors="replace") as f:
                 text = f.read()
-        # otherwise, execute function and cache results
+            return text
+
+        # otherwise, execute function and cache results; a stale cached copy is
+        # revalidated rather than downloaded again if the page hasn't changed
+        modified_since = None
+        if file_exists and allow_caching:
+            modified_since = os.path.getmtime(filename)
+        text = func(url, modified_since=modified_since)
+        if text is None:
+            os.utime(filename)
+            with open(filename, "r", encoding="utf-8", errors="replace") as f:
+                text = f.read()
         else:
-            text = func(url)
-            with open(filename, "w+", encoding="utf-8") as f:
+            # write to a temporary file and then move it into place, so that
+            # concurrent readers never see a partially-written cache file
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=CACHE_DIR, delete=False
+            ) as f:
                 f.write(text)
+            os.replace(f.name, filename)
         return text
 
     return wrapper
 
 
+def memoize_getter(fun):
+    """A decorator for memoizing zero-argument methods that return immutable
+    values, like strings, numbers, and dates.
+
+    The result is stored on the instance itself the first time it is computed,
+    so later calls are a dict lookup on the instance rather than going through
+    memoize's argument hashing and copying. Use memoize for methods that take
+    arguments or return mutable objects like DataFrames.
+    """
+    attr = f"_memoized_{fun.__name__}"
+
+    @functools.wraps(fun)
+    def wrapper(self):
+        if not sportsref.get_option("memoize"):
+            return fun(self)
+        try:
+            return self.__dict__[attr]
+        except KeyError:
+            ret = self.__dict__[attr] = fun(self)
+            return ret
+
+    return wrapper
+
+
 def get_class_instance_key(cls, args, kwargs):
     """
     Returns a unique identifier for a class instantiation.
@@ -189,8 +235,10 @@ def memoize(fun):
             ret = _copy(cache[key])
             return ret
         except TypeError:
-            print(
-                f"memoization type error in function {fun.__name__} for arguments {key}"
+            logger.error(
+                "memoization type error in function %s for arguments %s",
+                fun.__name__,
+                key,
             )
             raise
 
@@ -1,4 +1,7 @@
+import collections
+import concurrent.futures
 import datetime
+import logging
 import re
 
 import numpy as np
@@ -7,8 +10,27 @@ from pyquery import PyQuery as pq
 
 import sportsref
 
+logger = logging.getLogger(__name__)
+
 CLOCK_REGEX = re.compile(r"(\d+):(\d+)\.(\d+)")
 
+# names of the days of the week, indexed by datetime.date.weekday()
+WEEKDAYS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+# seconds elapsed in the game at the end of each period, indexed by period
+# (four 12-minute quarters, then 5-minute overtimes)
+QUARTER_END_SECS = tuple(
+    12 * 60 * min(qtr, 4) + 5 * 60 * max(qtr - 4, 0) for qtr in range(20)
+)
+
 
 class BoxScore(object, metaclass=sportsref.decorators.Cached):
     def __init__(self, boxscore_id):
@@ -23,42 +45,46 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
     def __repr__(self):
         return f"BoxScore({self.boxscore_id})"
 
+    @classmethod
+    def prefetch(cls, boxscore_ids, max_workers=16):
+        """Fetches the main pages of many games concurrently. Afterwards, the
+        games' methods are served from the memoized docs without any more
+        requests.
+
+        :boxscore_ids: An iterable of boxscore IDs.
+        :max_workers: The maximum number of concurrent fetches. Defaults to 16.
+        :returns: A list of BoxScore objects, in the same order as the IDs.
+        """
+        boxscores = [cls(boxscore_id) for boxscore_id in boxscore_ids]
+
+        sportsref.utils.prefetch_docs(boxscores, "get_main_doc", max_workers)
+        return boxscores
+
     @sportsref.decorators.memoize
     def get_main_doc(self):
         url = f"{sportsref.nba.BASE_URL}/boxscores/{self.boxscore_id}.html"
-        doc = pq(sportsref.utils.get_html(url))
+        doc = sportsref.utils.parse_html(sportsref.utils.get_html(url))
         return doc
 
     @sportsref.decorators.memoize
     def get_subpage_doc(self, page):
         url = f"{sportsref.nba.BASE_URL}/boxscores/{page}/{self.boxscore_id}.html"
-        doc = pq(sportsref.utils.get_html(url))
+        doc = sportsref.utils.parse_html(sportsref.utils.get_html(url))
         return doc
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def date(self):
         """Returns the date of the game. See Python datetime.date documentation
         for more.
         :returns: A datetime.date object with year, month, and day attributes.
         """
-        match = re.match(r"(\d{4})(\d{2})(\d{2})", self.boxscore_id)
-        year, month, day = list(map(int, match.groups()))
+        bs_id = self.boxscore_id
+        year, month, day = int(bs_id[:4]), int(bs_id[4:6]), int(bs_id[6:8])
         return datetime.date(year=year, month=month, day=day)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def weekday(self):
-        days = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
-        date = self.date()
-        wd = date.weekday()
-        return days[wd]
+        return WEEKDAYS[self.date().weekday()]
 
     @sportsref.decorators.memoize
     def linescore(self):
@@ -69,7 +95,7 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
         df.index = ["away", "home"]
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def home(self):
         """Returns home team ID.
         :returns: 3-character string representing home team's ID.
@@ -77,7 +103,7 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
         linescore = self.linescore()
         return linescore.loc["home", "team_id"]
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def away(self):
         """Returns away team ID.
         :returns: 3-character string representing away team's ID.
@@ -85,7 +111,7 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
         linescore = self.linescore()
         return linescore.loc["away", "team_id"]
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def home_score(self):
         """Returns score of the home team.
         :returns: int of the home score.
@@ -93,7 +119,7 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
         linescore = self.linescore()
         return linescore.loc["home", "T"]
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def away_score(self):
         """Returns score of the away team.
         :returns: int of the away score.
@@ -101,7 +127,7 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
         linescore = self.linescore()
         return linescore.loc["away", "T"]
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def winner(self):
         """Returns the team ID of the winning team. Returns NaN if a tie."""
         hm_score = self.home_score()
@@ -113,7 +139,7 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
         else:
             return None
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def season(self):
         """
         Returns the year ID of the season in which this game took place.
@@ -177,87 +203,96 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
             False.
         :returns: pandas DataFrame of play-by-play. Similar to GPF.
         """
-        try:
-            doc = self.get_subpage_doc("pbp")
-        except Exception:
-            raise ValueError(
-                f"Error fetching PBP subpage for boxscore {self.boxscore_id}"
-            )
+        # parsing plays also needs the main page, so fetch it concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            main_doc_future = executor.submit(self.get_main_doc)
+            try:
+                doc = self.get_subpage_doc("pbp")
+            except Exception:
+                raise ValueError(
+                    f"Error fetching PBP subpage for boxscore {self.boxscore_id}"
+                )
+            main_doc_future.result()
 
         table = doc("table#pbp")
         trs = [
             tr
-            for tr in list(table("tr").items())
-            if (
-                not tr.attr["class"]
-                or (tr.attr["id"] and tr.attr["id"].startswith("q"))
-            )
+            for tr in table[0].iter("tr")
+            if not tr.get("class") or tr.get("id", "").startswith("q")
         ]
-        rows = [tr.children("td") for tr in trs]
-        n_rows = len(trs)
-        data = []
+        # accumulate plays column-wise; keys missing from a play are NaN
+        columns = collections.defaultdict(list)
+        n_plays = 0
         cur_qtr = 0
-
-        for i in range(n_rows):
-            tr = trs[i]
-            row = rows[i]
+        # look up teams and rosters once for the whole game, not once per play
+        game_context = sportsref.nba.pbp._game_context(self.boxscore_id)
+
+        def add_play(play):
+            nonlocal n_plays
+            for key, val in play.items():
+                col = columns[key]
+                col.extend([np.nan] * (n_plays - len(col)))
+                col.append(val)
+            n_plays += 1
+
+        for tr in trs:
             play = {}
 
             # increment cur_qtr when we hit a new quarter
-            if tr.attr["id"] and tr.attr["id"].startswith("q"):
-                assert int(tr.attr["id"][1:]) == cur_qtr + 1
+            tr_id = tr.get("id", "")
+            if tr_id.startswith("q"):
+                assert int(tr_id[1:]) == cur_qtr + 1
                 cur_qtr += 1
                 continue
 
-            # add time of play to entry
-            clock_str = row.eq(0).text()
-            mins, secs, tenths = list(
-                map(int, re.match(CLOCK_REGEX, clock_str).groups())
-            )
-            secs_in_period = 12 * 60 * min(cur_qtr, 4) + 5 * 60 * (
-                cur_qtr - 4 if cur_qtr > 4 else 0
-            )
-            secs_elapsed = secs_in_period - (60 * mins + secs + 0.1 * tenths)
-            play["secs_elapsed"] = secs_elapsed
+            # add time of play to entry (converted to seconds below)
+            tds = tr.findall("td")
+            clock_str = tds[0].text_content().strip()
             play["clock_str"] = clock_str
             play["quarter"] = cur_qtr
 
             # handle single play description
             # ex: beginning/end of quarter, jump ball
-            if row.length == 2:
-                desc = row.eq(1)
+            if len(tds) == 2:
+                desc_text = tds[1].text_content().strip()
+                desc_lower = desc_text.lower()
                 # handle jump balls
-                if desc.text().lower().startswith("jump ball: "):
+                if desc_lower.startswith("jump ball: "):
                     play["is_jump_ball"] = True
-                    jump_ball_str = sportsref.utils.flatten_links(desc)
+                    jump_ball_str = sportsref.utils.flatten_links(pq(tds[1]))
                     play.update(
                         sportsref.nba.pbp.parse_play(
-                            self.boxscore_id, jump_ball_str, is_home=None
+                            self.boxscore_id,
+                            jump_ball_str,
+                            is_home=None,
+                            game_context=game_context,
                         )
                     )
                 # ignore rows marking beginning/end of quarters
-                elif desc.text().lower().startswith(
-                    "start of "
-                ) or desc.text().lower().startswith("end of "):
+                elif desc_lower.startswith("start of ") or desc_lower.startswith(
+                    "end of "
+                ):
                     continue
                 # if another case, log and continue
                 else:
-                    if not desc.text().lower().startswith("end of "):
-                        print(
-                            f"{self.boxscore_id}, Q{cur_qtr}, {clock_str} other case: {desc.text()}"
-                        )
+                    logger.warning(
+                        "%s, Q%s, %s other case: %s",
+                        self.boxscore_id,
+                        cur_qtr,
+                        clock_str,
+                        desc_text,
+                    )
                     continue
 
             # handle team play description
             # ex: shot, turnover, rebound, foul, sub, etc.
-            elif row.length == 6:
-                aw_desc, hm_desc = row.eq(1), row.eq(5)
-                is_hm_play = bool(hm_desc.text())
-                desc = hm_desc if is_hm_play else aw_desc
-                desc = sportsref.utils.flatten_links(desc)
+            elif len(tds) == 6:
+                is_hm_play = bool(tds[5].text_content().strip())
+                desc_td = tds[5] if is_hm_play else tds[1]
+                desc = sportsref.utils.flatten_links(pq(desc_td))
                 # parse the play
                 new_play = sportsref.nba.pbp.parse_play(
-                    self.boxscore_id, desc, is_hm_play
+                    self.boxscore_id, desc, is_hm_play, game_context=game_context
                 )
                 if not new_play:
                     continue
@@ -268,23 +303,33 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
                     # first, update and append the first row
                     orig_play = dict(play)
                     play.update(new_play[0])
-                    data.append(play)
+                    add_play(play)
                     # second, set up the second row to be appended below
                     play = orig_play
                     new_play = new_play[1]
                 elif new_play.get("is_error"):
-                    print(f"can't parse: {desc}, boxscore: {self.boxscore_id}")
+                    logger.warning(
+                        "can't parse: %s, boxscore: %s", desc, self.boxscore_id
+                    )
                     # import pdb; pdb.set_trace()
                 play.update(new_play)
 
             # otherwise, I don't know what this was
             else:
-                raise Exception(f"don't know how to handle row of length {row.length}")
+                raise Exception(f"don't know how to handle row of length {len(tds)}")
+
+            add_play(play)
 
-            data.append(play)
+        # convert to DataFrame and compute time elapsed for all plays at once
+        for col in columns.values():
+            col.extend([np.nan] * (n_plays - len(col)))
+        df = pd.DataFrame(columns)
+        clock = df["clock_str"].str.extract(CLOCK_REGEX).astype(int)
+        secs_in_period = np.take(QUARTER_END_SECS, df["quarter"].values)
+        secs_left = 60 * clock[0] + clock[1] + 0.1 * clock[2]
+        df.insert(0, "secs_elapsed", secs_in_period - secs_left)
 
-        # convert to DataFrame and clean columns
-        df = pd.DataFrame.from_records(data)
+        # clean columns
         df.sort_values("secs_elapsed", inplace=True, kind="mergesort")
         df = sportsref.nba.pbp.clean_features(df)
 
@@ -368,9 +413,8 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
         # makes sure off/def and poss_id are correct for subs after rearranging
         # some possessions above
         df.loc[df["is_sub"], ["off_team", "def_team", "poss_id"]] = np.nan
-        df.off_team.fillna(method="bfill", inplace=True)
-        df.def_team.fillna(method="bfill", inplace=True)
-        df.poss_id.fillna(method="bfill", inplace=True)
+        poss_cols = ["off_team", "def_team", "poss_id"]
+        df[poss_cols] = df[poss_cols].bfill()
         # make off_team and def_team NaN for jump balls
         if "is_jump_ball" in df.columns:
             df.loc[df["is_jump_ball"], ["off_team", "def_team"]] = np.nan
@@ -430,6 +474,10 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
         df["hm_score"] = np.cumsum(df["hm_pts"])
         df["aw_score"] = np.cumsum(df["aw_pts"])
 
+        # store small integer columns in the smallest integer dtype that fits
+        for col in ("quarter", "pts", "hm_pts", "aw_pts", "hm_score", "aw_score"):
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+
         # more helpful columns
         # "play" is differentiated from "poss" by counting OReb as new play
         # "plays" end with non-and1 FGA, TO, last non-tech FTA, or end of qtr
@@ -1,3 +1,4 @@
+import logging
 import re
 
 import numpy as np
@@ -5,6 +6,8 @@ import pandas as pd
 
 import sportsref
 
+logger = logging.getLogger(__name__)
+
 HM_LINEUP_COLS = ["hm_player{}".format(i) for i in range(1, 6)]
 AW_LINEUP_COLS = ["aw_player{}".format(i) for i in range(1, 6)]
 ALL_LINEUP_COLS = AW_LINEUP_COLS + HM_LINEUP_COLS
@@ -142,13 +145,28 @@ DEF3_TECH_RE = re.compile(def3_tech_re, flags=re.I)
 viol_re = rf"Violation by (?P<violator>{PLAYER_RE}|Team) \((?P<viol_type>.*)\)"
 VIOL_RE = re.compile(viol_re, flags=re.I)
 
+# sparse lineup columns, which are named after the players
+LINEUP_COL_RE = re.compile(rf"{PLAYER_RE}_in")
+
 
 def sparse_lineup_cols(df):
-    regex = "{}_in".format(PLAYER_RE)
-    return [c for c in df.columns if re.match(regex, c)]
+    return [c for c in df.columns if LINEUP_COL_RE.match(c)]
+
+
+def _game_context(boxscore_id):
+    """Returns the per-game information needed to parse each play of a game,
+    so that callers parsing a whole game can look it up once and pass it to
+    parse_play.
+
+    :param boxscore_id: the boxscore ID of the game
+    :returns: tuple of (away team ID, home team ID, frozenset of home player IDs)
+    """
+    bs = sportsref.nba.BoxScore(boxscore_id)
+    hm_roster = frozenset(bs.basic_stats().query("is_home == True").player_id.values)
+    return bs.away(), bs.home(), hm_roster
 
 
-def parse_play(boxscore_id, details, is_home):
+def parse_play(boxscore_id, details, is_home, game_context=None):
     """Parse play details from a play-by-play string describing a play.
 
     Assuming valid input, this function returns structured data in a dictionary
@@ -158,6 +176,8 @@ def parse_play(boxscore_id, details, is_home):
     :param boxscore_id: the boxscore ID of the play
     :param details: detail string for the play
     :param is_home: bool indicating whether the offense is at home
+    :param game_context: the result of _game_context(boxscore_id), if already
+        computed; looked up from the boxscore if None
     :param returns: dictionary of play attributes or None if invalid
     :rtype: dictionary or None
     """
@@ -165,10 +185,9 @@ def parse_play(boxscore_id, details, is_home):
     if not details or not isinstance(details, str):
         return None
 
-    bs = sportsref.nba.BoxScore(boxscore_id)
-    aw, hm = bs.away(), bs.home()
-    season = sportsref.nba.Season(bs.season())
-    hm_roster = set(bs.basic_stats().query("is_home == True").player_id.values)
+    if game_context is None:
+        game_context = _game_context(boxscore_id)
+    aw, hm, hm_roster = game_context
 
     play = {}
     play["detail"] = details
@@ -176,7 +195,7 @@ def parse_play(boxscore_id, details, is_home):
     play["away"] = aw
     play["is_home_play"] = is_home
 
-    match = re.match(SHOT_RE, details)
+    match = SHOT_RE.match(details)
     if match:
         play["is_fga"] = True
         play.update(match.groupdict())
@@ -191,13 +210,13 @@ def parse_play(boxscore_id, details, is_home):
         play["def_team"] = aw if shooter_home else hm
         return play
 
-    match = re.match(JUMP_RE, details)
+    match = JUMP_RE.match(details)
     if match:
         play["is_jump_ball"] = True
         play.update(match.groupdict())
         return play
 
-    match = re.match(REB_RE, details)
+    match = REB_RE.match(details)
     if match:
         play["is_reb"] = True
         play.update(match.groupdict())
@@ -213,7 +232,7 @@ def parse_play(boxscore_id, details, is_home):
         play["def_team"] = play["reb_team"] if play["is_dreb"] else other
         return play
 
-    match = re.match(FT_RE, details)
+    match = FT_RE.match(details)
     if match:
         play["is_fta"] = True
         play.update(match.groupdict())
@@ -233,7 +252,7 @@ def parse_play(boxscore_id, details, is_home):
             play["def_team"] = aw if ft_home else hm
         return play
 
-    match = re.match(SUB_RE, details)
+    match = SUB_RE.match(details)
     if match:
         play["is_sub"] = True
         play.update(match.groupdict())
@@ -241,7 +260,7 @@ def parse_play(boxscore_id, details, is_home):
         play["sub_team"] = hm if sub_home else aw
         return play
 
-    match = re.match(TO_RE, details)
+    match = TO_RE.match(details)
     if match:
         play["is_to"] = True
         play.update(match.groupdict())
@@ -267,7 +286,7 @@ def parse_play(boxscore_id, details, is_home):
             play["def_team"] = aw if to_home else hm
         return play
 
-    match = re.match(SHOT_FOUL_RE, details)
+    match = SHOT_FOUL_RE.match(details)
     if match:
         play["is_pf"] = True
         play["is_shot_foul"] = True
@@ -279,7 +298,7 @@ def parse_play(boxscore_id, details, is_home):
         play["foul_team"] = play["def_team"]
         return play
 
-    match = re.match(OFF_FOUL_RE, details)
+    match = OFF_FOUL_RE.match(details)
     if match:
         play["is_pf"] = True
         play["is_off_foul"] = True
@@ -294,7 +313,7 @@ def parse_play(boxscore_id, details, is_home):
         play["foul_team"] = play["off_team"]
         return play
 
-    match = re.match(FOUL_RE, details)
+    match = FOUL_RE.match(details)
     if match:
         play["is_pf"] = True
         play.update(match.groupdict())
@@ -315,7 +334,7 @@ def parse_play(boxscore_id, details, is_home):
     #     p.update(m.groupdict())
     #     p['off_team'] =
 
-    match = re.match(LOOSE_BALL_RE, details)
+    match = LOOSE_BALL_RE.match(details)
     if match:
         play["is_pf"] = True
         play["is_loose_ball_foul"] = True
@@ -327,7 +346,7 @@ def parse_play(boxscore_id, details, is_home):
     # parsing punching fouls
     # TODO
 
-    match = re.match(AWAY_FROM_BALL_RE, details)
+    match = AWAY_FROM_BALL_RE.match(details)
     if match:
         play["is_pf"] = True
         play["is_away_from_play_foul"] = True
@@ -337,7 +356,7 @@ def parse_play(boxscore_id, details, is_home):
         play["foul_team"] = hm if foul_on_home else aw
         return play
 
-    match = re.match(INBOUND_RE, details)
+    match = INBOUND_RE.match(details)
     if match:
         play["is_pf"] = True
         play["is_inbound_foul"] = True
@@ -348,7 +367,7 @@ def parse_play(boxscore_id, details, is_home):
         play["foul_team"] = play["def_team"]
         return play
 
-    match = re.match(FLAGRANT_RE, details)
+    match = FLAGRANT_RE.match(details)
     if match:
         play["is_pf"] = True
         play["is_flagrant"] = True
@@ -357,7 +376,7 @@ def parse_play(boxscore_id, details, is_home):
         play["foul_team"] = hm if foul_on_home else aw
         return play
 
-    match = re.match(CLEAR_PATH_RE, details)
+    match = CLEAR_PATH_RE.match(details)
     if match:
         play["is_pf"] = True
         play["is_clear_path_foul"] = True
@@ -368,11 +387,12 @@ def parse_play(boxscore_id, details, is_home):
         play["foul_team"] = play["def_team"]
         return play
 
-    match = re.match(TIMEOUT_RE, details)
+    match = TIMEOUT_RE.match(details)
     if match:
         play["is_timeout"] = True
         play.update(match.groupdict())
         is_official_to = play["timeout_team"].lower() == "official"
+        season = sportsref.nba.Season(sportsref.nba.BoxScore(boxscore_id).season())
         name_to_id = season.team_names_to_ids()
         play["timeout_team"] = (
             "Official"
@@ -381,7 +401,7 @@ def parse_play(boxscore_id, details, is_home):
         )
         return play
 
-    match = re.match(TECH_RE, details)
+    match = TECH_RE.match(details)
     if match:
         play["is_tech_foul"] = True
         play.update(match.groupdict())
@@ -394,7 +414,7 @@ def parse_play(boxscore_id, details, is_home):
         play["foul_team"] = hm if foul_on_home else aw
         return play
 
-    match = re.match(EJECT_RE, details)
+    match = EJECT_RE.match(details)
     if match:
         play["is_ejection"] = True
         play.update(match.groupdict())
@@ -405,7 +425,7 @@ def parse_play(boxscore_id, details, is_home):
             play["ejectee_team"] = hm if eject_home else aw
         return play
 
-    match = re.match(DEF3_TECH_RE, details)
+    match = DEF3_TECH_RE.match(details)
     if match:
         play["is_tech_foul"] = True
         play["is_def_three_secs"] = True
@@ -416,7 +436,7 @@ def parse_play(boxscore_id, details, is_home):
         play["foul_team"] = play["def_team"]
         return play
 
-    match = re.match(VIOL_RE, details)
+    match = VIOL_RE.match(details)
     if match:
         play["is_viol"] = True
         play.update(match.groupdict())
@@ -459,10 +479,8 @@ def clean_features(df):
     df.loc[df.is_tech_fta, ["fta_num", "tot_fta"]] = 1
 
     # fill in NaN's/fix off_team and def_team columns
-    df.off_team.fillna(method="bfill", inplace=True)
-    df.def_team.fillna(method="bfill", inplace=True)
-    df.off_team.fillna(method="ffill", inplace=True)
-    df.def_team.fillna(method="ffill", inplace=True)
+    team_cols = ["off_team", "def_team"]
+    df[team_cols] = df[team_cols].bfill().ffill()
 
     return df
 
@@ -563,10 +581,10 @@ def get_period_starters(df):
                 break
 
         if len(hm_starters) != 5 or len(aw_starters) != 5:
-            print(
-                "WARNING: wrong number of starters for a team in Q{} of {}".format(
-                    qtr, df.boxscore_id.iloc[0]
-                )
+            logger.warning(
+                "wrong number of starters for a team in Q%s of %s",
+                qtr,
+                df.boxscore_id.iloc[0],
             )
 
     return period_starters
@@ -658,11 +676,13 @@ def get_dense_lineups(df):
             # if the sub was double-entered and it's already been executed...
             if row["sub_in"] in sub_lineup and row["sub_out"] not in sub_lineup:
                 return aw_lineup, hm_lineup
-            # otherwise, let's print and pretend this never happened
-            print(
-                "ERROR IN SUB IN {}, Q{}, {}: {}".format(
-                    row["boxscore_id"], row["quarter"], row["clock_str"], row["detail"]
-                )
+            # otherwise, let's log and pretend this never happened
+            logger.error(
+                "error in sub in %s, Q%s, %s: %s",
+                row["boxscore_id"],
+                row["quarter"],
+                row["clock_str"],
+                row["detail"],
             )
             raise
         return aw_lineup, hm_lineup
@@ -739,8 +759,7 @@ def get_dense_lineups(df):
         )
 
         if missing_df.empty:
-            # TODO: log this as a warning (or error?)
-            print(
+            logger.warning(
                 "There are NaNs in the lineup data, but no players were "
                 "found to be missing significant minutes"
             )
@@ -1,12 +1,14 @@
 import datetime
 import re
 
-from pyquery import PyQuery as pq
-
 import sportsref
 
 __all__ = ["Player"]
 
+WEIGHT_REGEX = re.compile(r"(\d+)lb")
+HAND_REGEX = re.compile(r"Shoots:\s*(L|R)")
+DRAFT_PICK_REGEX = re.compile(r"(\d+)\w{,3}\s+?overall")
+
 
 class Player(object, metaclass=sportsref.decorators.Cached):
 
@@ -31,20 +33,35 @@ class Player(object, metaclass=sportsref.decorators.Cached):
     def __str__(self):
         return self.name()
 
+    @classmethod
+    def prefetch(cls, player_ids, max_workers=16):
+        """Fetches the main pages of many players concurrently. Afterwards, the
+        players' methods are served from the memoized docs without any more
+        requests.
+
+        :player_ids: An iterable of player IDs.
+        :max_workers: The maximum number of concurrent fetches. Defaults to 16.
+        :returns: A list of Player objects, in the same order as the IDs.
+        """
+        players = [cls(player_id) for player_id in player_ids]
+
+        sportsref.utils.prefetch_docs(players, "get_main_doc", max_workers)
+        return players
+
     @sportsref.decorators.memoize
     def get_main_doc(self):
-        return pq(sportsref.utils.get_html(self.main_url))
+        return sportsref.utils.parse_html(sportsref.utils.get_html(self.main_url))
 
     @sportsref.decorators.memoize
     def get_sub_doc(self, rel_url):
         url = f"{self.url_base}/{rel_url}"
-        return pq(sportsref.utils.get_html(url))
+        return sportsref.utils.parse_html(sportsref.utils.get_html(url))
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def name(self):
         """Returns the name of the player as a string."""
-        doc = self.get_main_doc()
-        return doc('h1[itemprop="name"]').text()
+        root = self.get_main_doc()[0]
+        return " ".join(root.xpath('string(//h1[@itemprop="name"])').split())
 
     @sportsref.decorators.memoize
     def age(self, year, month=2, day=1):
@@ -55,77 +72,76 @@ class Player(object, metaclass=sportsref.decorators.Cached):
         :day: int representing the day within the month (1-31).
         :returns: Age in years as a float.
         """
-        doc = self.get_main_doc()
-        date_string = doc('span[itemprop="birthDate"]').attr("data-birth")
-        regex = r"(\d{4})\-(\d{2})\-(\d{2})"
-        date_args = list(map(int, re.match(regex, date_string).groups()))
+        root = self.get_main_doc()[0]
+        date_string = next(
+            iter(root.xpath('//span[@itemprop="birthDate"]/@data-birth')), None
+        )
+        date_args = list(map(int, date_string.split("-")))
         birth_date = datetime.date(*date_args)
         age_date = datetime.date(year=year, month=month, day=day)
         delta = age_date - birth_date
         age = delta.days / 365.0
         return age
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def position(self):
         """TODO: Docstring for position.
         :returns: TODO
         """
         raise Exception("not yet implemented - nba.Player.position")
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def height(self):
         """Returns the player's height (in inches).
         :returns: An int representing a player's height in inches.
         """
-        doc = self.get_main_doc()
-        raw = doc('span[itemprop="height"]').text()
+        root = self.get_main_doc()[0]
+        raw = root.xpath('string(//span[@itemprop="height"])').strip()
         try:
             feet, inches = list(map(int, raw.split("-")))
             return feet * 12 + inches
         except ValueError:
             return None
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def weight(self):
         """Returns the player's weight (in pounds).
         :returns: An int representing a player's weight in pounds.
         """
-        doc = self.get_main_doc()
-        raw = doc('span[itemprop="weight"]').text()
+        root = self.get_main_doc()[0]
+        raw = root.xpath('string(//span[@itemprop="weight"])').strip()
         try:
-            weight = re.match(r"(\d+)lb", raw).group(1)
+            weight = WEIGHT_REGEX.match(raw).group(1)
             return int(weight)
         except ValueError:
             return None
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def hand(self):
         """Returns the player's handedness.
         :returns: 'L' for left-handed, 'R' for right-handed.
         """
-        doc = self.get_main_doc()
-        hand = re.search(r"Shoots:\s*(L|R)", doc.text()).group(1)
+        root = self.get_main_doc()[0]
+        text = root.xpath('string(//div[@id="meta"]//p[contains(., "Shoots")])')
+        hand = HAND_REGEX.search(text).group(1)
         return hand
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def draft_pick(self):
         """Returns when in the draft the player was picked.
         :returns: TODO
         """
-        doc = self.get_main_doc()
+        root = self.get_main_doc()[0]
         try:
-            p_tags = doc("div#meta p")
-            draft_p_tag = next(
-                p for p in list(p_tags.items()) if p.text().lower().startswith("draft")
-            )
-            draft_pick = int(
-                re.search(r"(\d+)\w{,3}\s+?overall", draft_p_tag.text()).group(1)
+            text = root.xpath(
+                'string(//div[@id="meta"]//p[starts-with(normalize-space(), "Draft")])'
             )
+            draft_pick = int(DRAFT_PICK_REGEX.search(text).group(1))
             return draft_pick
         except Exception:
             return None
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def draft_year(self):
         """Returns the year the player was selected (or undrafted).
         :returns: TODO
@@ -1,8 +1,11 @@
+import logging
+
 import pandas as pd
-from pyquery import PyQuery as pq
 
 import sportsref
 
+logger = logging.getLogger(__name__)
+
 
 class Season(object, metaclass=sportsref.decorators.Cached):
 
@@ -24,16 +27,45 @@ class Season(object, metaclass=sportsref.decorators.Cached):
     def __repr__(self):
         return "Season({})".format(self.yr)
 
+    @classmethod
+    def bulk(cls, years, pages=("main",)):
+        """Returns Season objects for many years, fetching the given pages for
+        all of them concurrently so that later calls hit the memoized docs.
+
+        :years: An iterable of years.
+        :pages: The pages to prefetch for each season; 'main' refers to the
+            main season page and anything else is treated as a subpage, e.g.
+            'per_game' or 'games-october'. Defaults to ('main',).
+        :returns: A list of Season objects, in the same order as the years.
+        """
+        seasons = [cls(yr) for yr in years]
+        fetches = list(
+            dict.fromkeys((season, page) for season in seasons for page in pages)
+        )
+
+        def fetch(season_page):
+            season, page = season_page
+            try:
+                if page == "main":
+                    season.get_main_doc()
+                else:
+                    season.get_sub_doc(page)
+            except ValueError:
+                pass
+
+        sportsref.utils.thread_map(fetch, fetches)
+        return seasons
+
     def _subpage_url(self, page):
-        return sportsref.nba.BASE_URL + "/leagues/NBA_{}_{}.html".format(self.yr, page)
+        return f"{sportsref.nba.BASE_URL}/leagues/NBA_{self.yr}_{page}.html"
 
     @sportsref.decorators.memoize
     def get_main_doc(self):
         """Returns PyQuery object for the main season URL.
         :returns: PyQuery object.
         """
-        url = sportsref.nba.BASE_URL + "/leagues/NBA_{}.html".format(self.yr)
-        return pq(sportsref.utils.get_html(url))
+        url = f"{sportsref.nba.BASE_URL}/leagues/NBA_{self.yr}.html"
+        return sportsref.utils.parse_html(sportsref.utils.get_html(url))
 
     @sportsref.decorators.memoize
     def get_sub_doc(self, subpage):
@@ -42,7 +74,7 @@ class Season(object, metaclass=sportsref.decorators.Cached):
         :returns: PyQuery object.
         """
         html = sportsref.utils.get_html(self._subpage_url(subpage))
-        return pq(html)
+        return sportsref.utils.parse_html(html)
 
     @sportsref.decorators.memoize
     def get_team_ids(self):
@@ -53,14 +85,14 @@ class Season(object, metaclass=sportsref.decorators.Cached):
         if not df.empty:
             return df.index.tolist()
         else:
-            print("ERROR: no teams found")
+            logger.error("no teams found")
             return []
 
     @sportsref.decorators.memoize
-    def team_ids_to_names(self):
-        """Mapping from 3-letter team IDs to full team names.
-        :returns: Dictionary with team IDs as keys and full team strings as
-        values.
+    def _team_id_name_maps(self):
+        """Builds the team ID -> name and team name -> ID mappings in a single
+        pass over the team stats table.
+        :returns: Tuple of (ids_to_names, names_to_ids) dictionaries.
         """
         doc = self.get_main_doc()
         table = doc("table#team-stats-per_game")
@@ -70,15 +102,25 @@ class Season(object, metaclass=sportsref.decorators.Cached):
         team_names = unflattened["team_name"]
         if len(team_names) != len(team_ids):
             raise Exception("team names and team IDs don't align")
-        return dict(list(zip(team_ids, team_names)))
+        ids_to_names = {}
+        names_to_ids = {}
+        for team_id, team_name in zip(team_ids, team_names):
+            ids_to_names[team_id] = team_name
+            names_to_ids[team_name] = team_id
+        return ids_to_names, names_to_ids
+
+    def team_ids_to_names(self):
+        """Mapping from 3-letter team IDs to full team names.
+        :returns: Dictionary with team IDs as keys and full team strings as
+        values.
+        """
+        return self._team_id_name_maps()[0]
 
-    @sportsref.decorators.memoize
     def team_names_to_ids(self):
         """Mapping from full team names to 3-letter team IDs.
-        :returns: Dictionary with tean names as keys and team IDs as values.
+        :returns: Dictionary with team names as keys and team IDs as values.
         """
-        d = self.team_ids_to_names()
-        return {v: k for k, v in list(d.items())}
+        return self._team_id_name_maps()[1]
 
     @sportsref.decorators.memoize
     @sportsref.decorators.kind_rpb(include_type=True)
@@ -92,10 +134,17 @@ class Season(object, metaclass=sportsref.decorators.Cached):
         :rtype: pd.DataFrame
         """
         kind = kind.upper()[0]
-        dfs = []
 
-        # get games from each month
-        for month in (
+        def get_month_games(month):
+            try:
+                doc = self.get_sub_doc("games-{}".format(month))
+            except ValueError:
+                return None
+            table = doc("table#schedule")
+            return sportsref.utils.parse_table(table)
+
+        # get games from each month, fetching the monthly pages concurrently
+        months = (
             "october",
             "november",
             "december",
@@ -105,20 +154,14 @@ class Season(object, metaclass=sportsref.decorators.Cached):
             "april",
             "may",
             "june",
-        ):
-            try:
-                doc = self.get_sub_doc("games-{}".format(month))
-            except ValueError:
-                continue
-            table = doc("table#schedule")
-            df = sportsref.utils.parse_table(table)
-            dfs.append(df)
-        df = pd.concat(dfs).reset_index(drop=True)
+        )
+        dfs = sportsref.utils.thread_map(get_month_games, months)
+        df = pd.concat([df for df in dfs if df is not None]).reset_index(drop=True)
 
         # figure out how many regular season games
         try:
             sportsref.utils.get_html(
-                "{}/playoffs/NBA_{}.html".format(sportsref.nba.BASE_URL, self.yr)
+                f"{sportsref.nba.BASE_URL}/playoffs/NBA_{self.yr}.html"
             )
             is_past_season = True
         except ValueError:
@@ -184,6 +227,9 @@ class Season(object, metaclass=sportsref.decorators.Cached):
         doc = self.get_main_doc()
         table = doc(selector)
         df = sportsref.utils.parse_table(table)
+        # store the repeated string columns (e.g. team_id) as categoricals
+        str_cols = df.select_dtypes(include="object").columns
+        df[str_cols] = df[str_cols].astype("category")
         df.set_index("team_id", inplace=True)
         return df
 
@@ -260,8 +306,8 @@ class Season(object, metaclass=sportsref.decorators.Cached):
 
     def roy_voting(self):
         """Returns a DataFrame containing information about ROY voting."""
-        url = "{}/awards/awards_{}.html".format(sportsref.nba.BASE_URL, self.yr)
-        doc = pq(sportsref.utils.get_html(url))
+        url = f"{sportsref.nba.BASE_URL}/awards/awards_{self.yr}.html"
+        doc = sportsref.utils.parse_html(sportsref.utils.get_html(url))
         table = doc("table#roy")
         df = sportsref.utils.parse_table(table)
         return df
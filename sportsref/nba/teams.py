@@ -1,5 +1,4 @@
 import numpy as np
-from pyquery import PyQuery as pq
 
 import sportsref
 
@@ -21,14 +20,15 @@ class Team(object, metaclass=sportsref.decorators.Cached):
     @sportsref.decorators.memoize
     def get_main_doc(self):
         team_url = f"{sportsref.nba.BASE_URL}/teams/{self.team_id}"
-        main_doc = pq(sportsref.utils.get_html(team_url))
+        main_doc = sportsref.utils.parse_html(sportsref.utils.get_html(team_url))
         return main_doc
 
     @sportsref.decorators.memoize
     def get_year_doc(self, yr_str):
-        return pq(sportsref.utils.get_html(self.team_year_url(yr_str)))
+        html = sportsref.utils.get_html(self.team_year_url(yr_str))
+        return sportsref.utils.parse_html(html)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def name(self):
         """Returns the real name of the franchise given the team ID.
 
@@ -2,14 +2,33 @@ import datetime
 import functools
 import re
 
+import lxml.etree
 import numpy as np
 import pandas as pd
-from pyquery import PyQuery as pq
 
 import sportsref
 
 __all__ = ["BoxScore"]
 
+LINE_REGEX = re.compile(r"(.+?) ([\-\.\d]+)$")
+WEEK_REGEX = re.compile(r"/years/(\d{4})/week_(\d+)\.htm")
+
+# names of the days of the week, indexed by datetime.date.weekday()
+WEEKDAYS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+# away and home rows of the linescore table, in that order
+LINESCORE_ROWS_XPATH = lxml.etree.XPath(
+    '(//table[contains(concat(" ", normalize-space(@class), " "), " linescore ")]'
+    "//tr)[position() = 2 or position() = 3]"
+)
+
 
 class BoxScore(object, metaclass=sportsref.decorators.Cached):
     def __init__(self, boxscore_id):
@@ -32,96 +51,99 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
     def __reduce__(self):
         return BoxScore, (self.boxscore_id,)
 
+    @classmethod
+    def prefetch(cls, boxscore_ids, max_workers=16):
+        """Fetches the pages of many games concurrently. Afterwards, the games'
+        methods are served from the memoized docs without any more requests.
+
+        :boxscore_ids: An iterable of boxscore IDs.
+        :max_workers: The maximum number of concurrent fetches. Defaults to 16.
+        :returns: A list of BoxScore objects, in the same order as the IDs.
+        """
+        boxscores = [cls(boxscore_id) for boxscore_id in boxscore_ids]
+
+        sportsref.utils.prefetch_docs(boxscores, "get_doc", max_workers)
+        return boxscores
+
     @sportsref.decorators.memoize
     def get_doc(self):
-        url = sportsref.nfl.BASE_URL + "/boxscores/{}.htm".format(self.boxscore_id)
-        doc = pq(sportsref.utils.get_html(url))
+        url = f"{sportsref.nfl.BASE_URL}/boxscores/{self.boxscore_id}.htm"
+        doc = sportsref.utils.parse_html(sportsref.utils.get_html(url))
         return doc
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def date(self):
         """Returns the date of the game. See Python datetime.date documentation
         for more.
         :returns: A datetime.date object with year, month, and day attributes.
         """
-        match = re.match(r"(\d{4})(\d{2})(\d{2})", self.boxscore_id)
-        year, month, day = list(map(int, match.groups()))
+        bs_id = self.boxscore_id
+        year, month, day = int(bs_id[:4]), int(bs_id[4:6]), int(bs_id[6:8])
         return datetime.date(year=year, month=month, day=day)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def weekday(self):
         """Returns the day of the week on which the game occurred.
         :returns: String representation of the day of the week for the game.
 
         """
-        days = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
-        date = self.date()
-        wd = date.weekday()
-        return days[wd]
+        return WEEKDAYS[self.date().weekday()]
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
+    def _linescore_info(self):
+        """Parses the teams and final scores from the linescore table in one
+        pass.
+        :returns: Tuple of (away team ID, home team ID, away score, home score).
+        """
+        doc = self.get_doc()
+        info = []
+        for tr in LINESCORE_ROWS_XPATH(doc[0]):
+            rel_url = tr.findall(".//a")[2].get("href")
+            score = tr.findall(".//td")[-1].text_content()
+            info.append((sportsref.utils.rel_url_to_id(rel_url), int(score)))
+        (away, away_score), (home, home_score) = info
+        return away, home, away_score, home_score
+
+    @sportsref.decorators.memoize_getter
     def home(self):
         """Returns home team ID.
         :returns: 3-character string representing home team's ID.
         """
-        doc = self.get_doc()
-        table = doc("table.linescore")
-        relURL = table("tr").eq(2)("a").eq(2).attr["href"]
-        home = sportsref.utils.rel_url_to_id(relURL)
-        return home
+        return self._linescore_info()[1]
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def away(self):
         """Returns away team ID.
         :returns: 3-character string representing away team's ID.
         """
-        doc = self.get_doc()
-        table = doc("table.linescore")
-        relURL = table("tr").eq(1)("a").eq(2).attr["href"]
-        away = sportsref.utils.rel_url_to_id(relURL)
-        return away
+        return self._linescore_info()[0]
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def home_score(self):
         """Returns score of the home team.
         :returns: int of the home score.
         """
-        doc = self.get_doc()
-        table = doc("table.linescore")
-        home_score = table("tr").eq(2)("td")[-1].text_content()
-        return int(home_score)
+        return self._linescore_info()[3]
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def away_score(self):
         """Returns score of the away team.
         :returns: int of the away score.
         """
-        doc = self.get_doc()
-        table = doc("table.linescore")
-        away_score = table("tr").eq(1)("td")[-1].text_content()
-        return int(away_score)
+        return self._linescore_info()[2]
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def winner(self):
         """Returns the team ID of the winning team. Returns NaN if a tie."""
-        hmScore = self.home_score()
-        awScore = self.away_score()
+        away, home, awScore, hmScore = self._linescore_info()
         if hmScore > awScore:
-            return self.home()
+            return home
         elif hmScore < awScore:
-            return self.away()
+            return away
         else:
             return None
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def week(self):
         """Returns the week in which this game took place. 18 is WC round, 19
         is Div round, 20 is CC round, 21 is SB.
@@ -129,13 +151,13 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
         """
         doc = self.get_doc()
         raw = doc("div#div_other_scores h2 a").attr["href"]
-        match = re.match(r"/years/{}/week_(\d+)\.htm".format(self.season()), raw)
-        if match:
-            return int(match.group(1))
+        match = WEEK_REGEX.match(raw)
+        if match and int(match.group(1)) == self.season():
+            return int(match.group(2))
         else:
             return 21  # super bowl is week 21
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def season(self):
         """
         Returns the year ID of the season in which this game took place.
@@ -168,31 +190,52 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
         doc = self.get_doc()
         a = doc("table#vis_starters")
         h = doc("table#home_starters")
-        data = []
+        # build the DataFrame column-wise rather than from a dict per row
+        player_ids, names, positions, teams, homes, offenses = [], [], [], [], [], []
         for h, table in enumerate((a, h)):
             team = self.home() if h else self.away()
-            for i, row in enumerate(table("tbody tr").items()):
-                datum = {}
-                datum["player_id"] = sportsref.utils.rel_url_to_id(
-                    row("a")[0].attrib["href"]
+            for i, row in enumerate(table("tbody tr")):
+                player_ids.append(
+                    sportsref.utils.rel_url_to_id(row.find(".//a").attrib["href"])
+                )
+                names.append(" ".join(row.find(".//th").text_content().split()))
+                positions.append(
+                    " ".join(
+                        " ".join(td.text_content() for td in row.iter("td")).split()
+                    )
                 )
-                datum["playerName"] = row("th").text()
-                datum["position"] = row("td").text()
-                datum["team"] = team
-                datum["home"] = h == 1
-                datum["offense"] = i <= 10
-                data.append(datum)
-        return pd.DataFrame(data)
+                teams.append(team)
+                homes.append(h == 1)
+                offenses.append(i <= 10)
+        return pd.DataFrame(
+            {
+                "player_id": player_ids,
+                "playerName": names,
+                "position": positions,
+                "team": teams,
+                "home": np.array(homes, dtype=bool),
+                "offense": np.array(offenses, dtype=bool),
+            }
+        )
 
     @sportsref.decorators.memoize
-    def line(self):
+    def game_info(self):
+        """Gets a dictionary of the entries in the game info table, which the
+        line, surface, over/under, coin toss and weather are parsed from.
+
+        :returns: A dictionary of game info, with flattened links.
+        """
         doc = self.get_doc()
         table = doc("table#game_info")
-        giTable = sportsref.utils.parse_info_table(table)
+        return sportsref.utils.parse_info_table(table)
+
+    @sportsref.decorators.memoize_getter
+    def line(self):
+        giTable = self.game_info()
         line_text = giTable.get("vegas_line", None)
         if line_text is None:
             return None
-        m = re.match(r"(.+?) ([\-\.\d]+)$", line_text)
+        m = LINE_REGEX.match(line_text)
         if m:
             favorite, line = m.groups()
             line = float(line)
@@ -204,27 +247,23 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
             line = 0
         return line
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def surface(self):
         """The playing surface on which the game was played.
 
         :returns: string representing the type of surface. Returns np.nan if
         not avaiable.
         """
-        doc = self.get_doc()
-        table = doc("table#game_info")
-        giTable = sportsref.utils.parse_info_table(table)
+        giTable = self.game_info()
         return giTable.get("surface", np.nan)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def over_under(self):
         """
         Returns the over/under for the game as a float, or np.nan if not
         available.
         """
-        doc = self.get_doc()
-        table = doc("table#game_info")
-        giTable = sportsref.utils.parse_info_table(table)
+        giTable = self.game_info()
         if "over_under" in giTable:
             ou = giTable["over_under"]
             return float(ou.split()[0])
@@ -241,9 +280,7 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
 
         :returns: Dictionary of coin toss-related info.
         """
-        doc = self.get_doc()
-        table = doc("table#game_info")
-        giTable = sportsref.utils.parse_info_table(table)
+        giTable = self.game_info()
         if "Won Toss" in giTable:
             # TODO: finish coinToss function
             pass
@@ -262,25 +299,20 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
 
         :returns: Dict of weather data.
         """
-        doc = self.get_doc()
-        table = doc("table#game_info")
-        giTable = sportsref.utils.parse_info_table(table)
+        giTable = self.game_info()
         if "weather" in giTable:
-            regex = (
-                r"(?:(?P<temp>\-?\d+) degrees )?"
-                r"(?:relative humidity (?P<relHumidity>\d+)%, )?"
-                r"(?:wind (?P<windMPH>\d+) mph, )?"
-                r"(?:wind chill (?P<windChill>\-?\d+))?"
-            )
-            m = re.match(regex, giTable["weather"])
-            d = m.groupdict()
-
-            # cast values to int
-            for k in d:
-                try:
-                    d[k] = int(d[k])
-                except TypeError:
-                    pass
+            d = {"temp": None, "windChill": None, "relHumidity": None, "windMPH": None}
+            # e.g. "65 degrees, relative humidity 70%, wind 10 mph, wind chill 60"
+            for part in giTable["weather"].split(", "):
+                words = part.split()
+                if part.endswith(" degrees"):
+                    d["temp"] = int(words[0])
+                elif part.startswith("relative humidity "):
+                    d["relHumidity"] = int(words[-1].rstrip("%"))
+                elif part.startswith("wind chill "):
+                    d["windChill"] = int(words[-1])
+                elif part.startswith("wind ") and part.endswith(" mph"):
+                    d["windMPH"] = int(words[1])
 
             # one-off fixes
             d["windChill"] = d["windChill"] if pd.notnull(d["windChill"]) else d["temp"]
@@ -326,36 +358,36 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
                 df[col] = df[col].shift(1)
         df.loc[0, ["pbp_score_hm", "pbp_score_aw"]] = 0
         # fill in WP NaN's
-        df.home_wp.fillna(method="ffill", inplace=True)
-        # fix first play border after diffing/shifting for WP and WPA
-        firstPlaysOfGame = df[df.secsElapsed == 0].index
-        line = self.line()
-        for i in firstPlaysOfGame:
-            initwp = sportsref.nfl.winProb.initialWinProb(line)
-            df.loc[i, "home_wp"] = initwp
-            df.loc[i, "home_wpa"] = df.loc[i + 1, "home_wp"] - initwp
-        # fix last play border after diffing/shifting for WP and WPA
-        lastPlayIdx = df.index[-1]
-        lastPlayWP = df.loc[lastPlayIdx, "home_wp"]
+        df["home_wp"] = df.home_wp.ffill()
+        # fix the WP and WPA borders on the raw arrays, then write them back
+        homeWP = df.home_wp.to_numpy(dtype=float, copy=True)
+        homeWPA = df.home_wpa.to_numpy(dtype=float, copy=True)
         # if a tie, final WP is 50%; otherwise, determined by winner
         winner = self.winner()
         finalWP = 50.0 if pd.isnull(winner) else (winner == self.home()) * 100.0
-        df.loc[lastPlayIdx, "home_wpa"] = finalWP - lastPlayWP
+        # fix first play border after diffing/shifting for WP and WPA
+        firstPlaysOfGame = np.flatnonzero(df.secsElapsed.to_numpy() == 0)
+        if len(firstPlaysOfGame):
+            initwp = sportsref.nfl.winProb.initialWinProb(self.line())
+            nextWP = np.append(homeWP[1:], np.nan)[firstPlaysOfGame]
+            homeWP[firstPlaysOfGame] = initwp
+            homeWPA[firstPlaysOfGame] = nextWP - initwp
+        # fix last play border after diffing/shifting for WP and WPA
+        homeWPA[-1] = finalWP - homeWP[-1]
         # fix WPA for timeouts and plays after timeouts
-        timeouts = df[df.isTimeout].index
-        for to in timeouts:
-            df.loc[to, "home_wpa"] = 0.0
-            if to + 2 in df.index:
-                wpa = df.loc[to + 2, "home_wp"] - df.loc[to + 1, "home_wp"]
-            else:
-                wpa = finalWP - df.loc[to + 1, "home_wp"]
-            df.loc[to + 1, "home_wpa"] = wpa
+        timeouts = np.flatnonzero(df.isTimeout.to_numpy(dtype=bool))
+        afterTimeouts = timeouts[timeouts + 1 < len(df)] + 1
+        # WP after each play, which is the final WP after the last play
+        nextWP = np.append(homeWP[1:], finalWP)
+        homeWPA[afterTimeouts] = nextWP[afterTimeouts] - homeWP[afterTimeouts]
+        homeWPA[timeouts] = 0.0
+        df["home_wp"] = homeWP
+        df["home_wpa"] = homeWPA
         # add team-related features to DataFrame
         df = sportsref.nfl.pbp._add_team_features(df)
         # fill distToGoal NaN's
         df["distToGoal"] = np.where(df.isKickoff, 65, df.distToGoal)
-        df.distToGoal.fillna(method="bfill", inplace=True)
-        df.distToGoal.fillna(method="ffill", inplace=True)  # for last play
+        df["distToGoal"] = df.distToGoal.bfill().ffill()  # ffill for last play
 
         return df
 
@@ -378,17 +410,19 @@ class BoxScore(object, metaclass=sportsref.decorators.Cached):
         """
         doc = self.get_doc()
         tableIDs = ("player_offense", "player_defense", "returns", "kicking")
-        dfs = []
-        for tID in tableIDs:
-            table = doc("table#{}".format(tID))
-            dfs.append(sportsref.utils.parse_table(table))
+        dfs = [sportsref.utils.parse_table(doc(f"table#{tID}")) for tID in tableIDs]
         dfs = [df for df in dfs if not df.empty]
+        if not dfs:
+            return pd.DataFrame()
+        if len(dfs) == 1:
+            return dfs[0].reset_index(drop=True)
+        # merge already returns a fresh RangeIndex, so no reset_index needed
         df = functools.reduce(
             lambda x, y: pd.merge(
                 x, y, how="outer", on=list(set(x.columns) & set(y.columns))
             ),
             dfs,
-        ).reset_index(drop=True)
+        )
         return df
 
     @sportsref.decorators.memoize
@@ -3,8 +3,6 @@ import json
 import os
 import time
 
-from pyquery import PyQuery as pq
-
 from ... import decorators, utils
 from .. import pbp
 
@@ -22,7 +20,7 @@ def GamePlayFinder(**kwargs):
     if kwargs.get("verbose", False):
         print(url)
     html = utils.get_html(url)
-    doc = pq(html)
+    doc = utils.parse_html(html)
 
     # parse
     table = doc("table#all_plays")
@@ -30,9 +28,9 @@ def GamePlayFinder(**kwargs):
 
     # parse score column
     if "score" in plays.columns:
-        oScore, dScore = list(zip(*plays.score.apply(lambda s: s.split("-"))))
-        plays["teamScore"] = oScore
-        plays["oppScore"] = dScore
+        scores = plays.score.str.split("-", n=1, expand=True)
+        plays["teamScore"] = scores[0]
+        plays["oppScore"] = scores[1]
     # add parsed pbp info
     if "description" in plays.columns:
         plays = pbp.expand_details(plays, detailCol="description")
@@ -166,7 +164,7 @@ def inputs_options_defaults():
         print("Regenerating GPFConstants file")
 
         html = utils.get_html(GPF_URL)
-        doc = pq(html)
+        doc = utils.parse_html(html)
 
         def_dict = {}
         # start with input elements
@@ -4,8 +4,6 @@ import os
 import time
 import urllib.parse
 
-from pyquery import PyQuery as pq
-
 from ... import decorators, utils
 
 PSF_URL = "http://www.pro-football-reference.com/" "play-index/psl_finder.cgi"
@@ -26,7 +24,7 @@ def PlayerSeasonFinder(**kwargs):
         if kwargs.get("verbose", False):
             print(url)
         html = utils.get_html(url)
-        doc = pq(html)
+        doc = utils.parse_html(html)
         table = doc("table#results")
         df = utils.parse_table(table)
         if df.empty:
@@ -150,7 +148,7 @@ def inputs_options_defaults():
         print("Regenerating PSFConstants file")
 
         html = utils.get_html(PSF_URL)
-        doc = pq(html)
+        doc = utils.parse_html(html)
 
         def_dict = {}
         # start with input elements
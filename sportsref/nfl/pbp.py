@@ -56,8 +56,11 @@ def expand_details(df, detailCol="detail"):
     df.qtr_time_remain.fillna(
         pd.Series(np.where(df.quarter == 4, "0:00", "15:00")), inplace=True
     )
-    # use _clean_features to clean up and add columns
-    new_df = df.apply(_clean_features, axis=1)
+    # use _clean_features to clean up and add columns (on plain dicts, which is
+    # much cheaper than building a Series for each row with df.apply)
+    new_df = pd.DataFrame(
+        [_clean_features(struct) for struct in df.to_dict("records")], index=df.index
+    )
     return new_df
 
 
@@ -386,7 +389,7 @@ def parse_play_details(details):
 def _clean_features(struct):
     """Cleans up the features collected in parse_play_details.
 
-    :struct: Pandas Series of features parsed from details string.
+    :struct: dict of features parsed from details string.
     :returns: the same dict, but with cleaner features (e.g., convert bools,
     ints, etc.)
     """
@@ -580,7 +583,7 @@ def _clean_features(struct):
     # create columns for EPA
     struct["team_epa"] = struct["exp_pts_after"] - struct["exp_pts_before"]
     struct["opp_epa"] = struct["exp_pts_before"] - struct["exp_pts_after"]
-    return pd.Series(struct)
+    return struct
 
 
 def _loc_to_features(loc):
@@ -632,11 +635,8 @@ def _add_team_columns(features):
         playAfterKickoff = row["isKickoff"]
 
     features = pd.DataFrame(features)
-    features.team.fillna(method="bfill", inplace=True)
-    features.opp.fillna(method="bfill", inplace=True)
-    # ffill for last row
-    features.team.fillna(method="ffill", inplace=True)
-    features.opp.fillna(method="ffill", inplace=True)
+    # bfill, then ffill for last row
+    features[["team", "opp"]] = features[["team", "opp"]].bfill().ffill()
     return features
 
 
@@ -1,20 +1,48 @@
 import datetime
 import re
-import urllib.parse
 
+import lxml.etree
 from pyquery import PyQuery as pq
 
 import sportsref
 
 __all__ = ["Player"]
 
+# keywords of the fields looked up in the paragraphs of a player's info box
+META_KEYWORDS = ("Position", "Throws", "Team", "Draft", "College", "High School")
+
+POSITION_REGEX = re.compile(r"Position\W*(\S+)", re.I)
+WEIGHT_REGEX = re.compile(r"(\d+)lb", re.I)
+HAND_REGEX = re.compile(r"Throws\W+(\S+)", re.I)
+TEAM_REGEX = re.compile(r"Team: (\w{3})")
+DRAFT_PICK_REGEX = re.compile(r"Draft.*? round \((\d+).*?overall\)", re.I)
+DRAFT_CLASS_REGEX = re.compile(r"Draft.*?of the (\d{4}) NFL", re.I)
+DRAFT_TEAM_REGEX = re.compile(r"Draft\W+(\w+)")
+COLLEGE_REGEX = re.compile(r"College:\s*(\S+)")
+HIGH_SCHOOL_REGEX = re.compile(r"High School:\s*(\S+)")
+
+# compiled once instead of translating a CSS selector on every table lookup
+TABLE_XPATH = lxml.etree.XPath("//table[@id=$table_id]")
+EITHER_TABLE_XPATH = lxml.etree.XPath(
+    "(//table[@id=$first_id] | //table[@id=$second_id])[1]"
+)
+
+
+def _get_table(doc, table_id):
+    """Selects the table with the given ID from a parsed page.
+
+    :doc: PyQuery object of the page.
+    :table_id: The HTML ID of the table.
+    :returns: PyQuery object containing the table (empty if not found).
+    """
+    return pq(TABLE_XPATH(doc[0], table_id=table_id))
+
 
 class Player(object, metaclass=sportsref.decorators.Cached):
     def __init__(self, player_id):
         self.player_id = player_id
-        self.mainURL = (sportsref.nfl.BASE_URL + "/players/{0[0]}/{0}.htm").format(
-            self.player_id
-        )
+        self.url_base = f"{sportsref.nfl.BASE_URL}/players/{player_id[0]}/{player_id}"
+        self.mainURL = self.url_base + ".htm"
 
     def __eq__(self, other):
         return self.player_id == other.player_id
@@ -34,34 +62,71 @@ class Player(object, metaclass=sportsref.decorators.Cached):
     def _subpage_url(self, page, year=None):
         # if no year, return career version
         if year is None:
-            return urllib.parse.urljoin(
-                self.mainURL, "{}/{}/".format(self.player_id, page)
-            )
+            return f"{self.url_base}/{page}/"
         # otherwise, return URL for a given year
         else:
-            return urllib.parse.urljoin(
-                self.mainURL, "{}/{}/{}/".format(self.player_id, page, year)
-            )
+            return f"{self.url_base}/{page}/{year}/"
 
     @sportsref.decorators.memoize
     def get_doc(self):
-        doc = pq(sportsref.utils.get_html(self.mainURL))
+        doc = sportsref.utils.parse_html(sportsref.utils.get_html(self.mainURL))
         return doc
 
     @sportsref.decorators.memoize
+    def get_subpage_doc(self, page, year=None):
+        url = self._subpage_url(page, year)
+        return sportsref.utils.parse_html(sportsref.utils.get_html(url))
+
+    @sportsref.decorators.memoize
+    def _meta_info(self):
+        """Parses the paragraphs of the player's info box once for all of the
+        accessors that look up a field in them.
+
+        :returns: Dictionary mapping each of META_KEYWORDS to a tuple of (text,
+            text with links flattened to IDs) of the paragraphs containing it.
+        """
+        root = self.get_doc()[0]
+        xpath = '//div[@id="meta"]//p[contains(., $keyword)]'
+        matches = {
+            keyword: pq(root.xpath(xpath, keyword=keyword)) for keyword in META_KEYWORDS
+        }
+        # get all plain text before flattening, which removes notes in place
+        texts = {keyword: matched.text() for keyword, matched in matches.items()}
+        return {
+            keyword: (texts[keyword], sportsref.utils.flatten_links(matched))
+            for keyword, matched in matches.items()
+        }
+
+    @sportsref.decorators.memoize
+    def _meta_fields(self):
+        """Walks the player's info box once to collect the fields that are
+        marked up directly rather than found by keyword.
+
+        :returns: Dictionary with the player's name (under "name"), birth date
+            string (under "birth") and the text of each itemprop span.
+        """
+        fields = {}
+        meta = self.get_doc()("div#meta")
+        if not meta:
+            return fields
+        for el in meta[0].iter("h1", "span"):
+            if el.tag == "h1":
+                fields.setdefault("name", " ".join(el.text_content().split()))
+            elif el.get("id") == "necro-birth":
+                fields.setdefault("birth", el.get("data-birth"))
+            elif el.get("itemprop"):
+                fields.setdefault(el.get("itemprop"), el.text_content().strip())
+        return fields
+
+    @sportsref.decorators.memoize_getter
     def name(self):
-        doc = self.get_doc()
-        name = doc("div#meta h1:first").text()
-        return name
+        return self._meta_fields().get("name", "")
 
     @sportsref.decorators.memoize
     def age(self, year, month=9, day=1):
-        doc = self.get_doc()
-        span = doc("div#meta span#necro-birth")
-        birthstring = span.attr("data-birth")
+        birthstring = self._meta_fields().get("birth")
         try:
-            dateargs = re.match(r"(\d{4})\-(\d{2})\-(\d{2})", birthstring).groups()
-            dateargs = list(map(int, dateargs))
+            dateargs = list(map(int, birthstring.split("-")))
             birthDate = datetime.date(*dateargs)
             delta = datetime.date(year=year, month=month, day=day) - birthDate
             age = delta.days / 365
@@ -69,115 +134,89 @@ class Player(object, metaclass=sportsref.decorators.Cached):
         except Exception:
             return None
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def position(self):
-        doc = self.get_doc()
-        rawText = (
-            doc("div#meta p").filter(lambda i, e: "Position" in e.text_content()).text()
-        )
-        rawPos = re.search(r"Position\W*(\S+)", rawText, re.I).group(1)
+        rawText = self._meta_info()["Position"][0]
+        rawPos = POSITION_REGEX.search(rawText).group(1)
         allPositions = rawPos.split("-")
         # right now, returning just the primary position for those with
         # multiple positions
         return allPositions[0]
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def height(self):
-        doc = self.get_doc()
-        rawText = doc('div#meta p span[itemprop="height"]').text()
+        rawText = self._meta_fields().get("height", "")
         try:
             feet, inches = list(map(int, rawText.split("-")))
             return feet * 12 + inches
         except ValueError:
             return None
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def weight(self):
-        doc = self.get_doc()
-        rawText = doc('div#meta p span[itemprop="weight"]').text()
+        rawText = self._meta_fields().get("weight", "")
         try:
-            weight = re.match(r"(\d+)lb", rawText, re.I).group(1)
+            weight = WEIGHT_REGEX.match(rawText).group(1)
             return int(weight)
         except AttributeError:
             return None
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def hand(self):
-        doc = self.get_doc()
         try:
-            rawText = (
-                doc("div#meta p")
-                .filter(lambda i, e: "Throws" in e.text_content())
-                .text()
-            )
-            rawHand = re.search(r"Throws\W+(\S+)", rawText, re.I).group(1)
+            rawText = self._meta_info()["Throws"][0]
+            rawHand = HAND_REGEX.search(rawText).group(1)
         except AttributeError:
             return None
         return rawHand[0]  # 'L' or 'R'
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def current_team(self):
-        doc = self.get_doc()
-        team = doc("div#meta p").filter(lambda i, e: "Team" in e.text_content())
-        text = sportsref.utils.flatten_links(team)
+        text = self._meta_info()["Team"][1]
         try:
-            m = re.match(r"Team: (\w{3})", text)
+            m = TEAM_REGEX.match(text)
             return m.group(1)
         except Exception:
             return None
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def draft_pick(self):
-        doc = self.get_doc()
-        rawDraft = (
-            doc("div#meta p").filter(lambda i, e: "Draft" in e.text_content()).text()
-        )
-        m = re.search(r"Draft.*? round \((\d+).*?overall\)", rawDraft, re.I)
+        rawDraft = self._meta_info()["Draft"][0]
+        m = DRAFT_PICK_REGEX.search(rawDraft)
         # if not drafted or taken in supplemental draft, return NaN
         if m is None or "Supplemental" in rawDraft:
             return None
         else:
             return int(m.group(1))
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def draft_class(self):
-        doc = self.get_doc()
-        rawDraft = (
-            doc("div#meta p").filter(lambda i, e: "Draft" in e.text_content()).text()
-        )
-        m = re.search(r"Draft.*?of the (\d{4}) NFL", rawDraft, re.I)
+        rawDraft = self._meta_info()["Draft"][0]
+        m = DRAFT_CLASS_REGEX.search(rawDraft)
         if not m:
             return None
         else:
             return int(m.group(1))
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def draft_team(self):
-        doc = self.get_doc()
-        rawDraft = doc("div#meta p").filter(lambda i, e: "Draft" in e.text_content())
         try:
-            draftStr = sportsref.utils.flatten_links(rawDraft)
-            m = re.search(r"Draft\W+(\w+)", draftStr)
+            draftStr = self._meta_info()["Draft"][1]
+            m = DRAFT_TEAM_REGEX.search(draftStr)
             return m.group(1)
         except Exception:
             return None
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def college(self):
-        doc = self.get_doc()
-        rawText = doc("div#meta p").filter(lambda i, e: "College" in e.text_content())
-        cleanedText = sportsref.utils.flatten_links(rawText)
-        college = re.search(r"College:\s*(\S+)", cleanedText).group(1)
+        cleanedText = self._meta_info()["College"][1]
+        college = COLLEGE_REGEX.search(cleanedText).group(1)
         return college
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize_getter
     def high_school(self):
-        doc = self.get_doc()
-        rawText = doc("div#meta p").filter(
-            lambda i, e: "High School" in e.text_content()
-        )
-        cleanedText = sportsref.utils.flatten_links(rawText)
-        hs = re.search(r"High School:\s*(\S+)", cleanedText).group(1)
+        cleanedText = self._meta_info()["High School"][1]
+        hs = HIGH_SCHOOL_REGEX.search(cleanedText).group(1)
         return hs
 
     @sportsref.decorators.memoize
@@ -190,9 +229,8 @@ class Player(object, metaclass=sportsref.decorators.Cached):
         return entire career gamelog. Defaults to None.
         :returns: A DataFrame with the player's career gamelog.
         """
-        url = self._subpage_url("gamelog", None)  # year is filtered later
-        doc = pq(sportsref.utils.get_html(url))
-        table = doc("table#stats") if kind == "R" else doc("table#stats_playoffs")
+        doc = self.get_subpage_doc("gamelog", None)  # year is filtered later
+        table = _get_table(doc, "stats" if kind == "R" else "stats_playoffs")
         df = sportsref.utils.parse_table(table)
         if year is not None:
             df = df.query("year == @year").reset_index(drop=True)
@@ -207,7 +245,7 @@ class Player(object, metaclass=sportsref.decorators.Cached):
         :returns: Pandas DataFrame with passing stats.
         """
         doc = self.get_doc()
-        table = doc("table#passing") if kind == "R" else doc("table#passing_playoffs")
+        table = _get_table(doc, "passing" if kind == "R" else "passing_playoffs")
         df = sportsref.utils.parse_table(table)
         return df
 
@@ -220,17 +258,15 @@ class Player(object, metaclass=sportsref.decorators.Cached):
         :returns: Pandas DataFrame with rushing/receiving stats.
         """
         doc = self.get_doc()
-        table = (
-            doc("table#rushing_and_receiving")
-            if kind == "R"
-            else doc("table#rushing_and_receiving_playoffs")
-        )
-        if not table:
-            table = (
-                doc("table#receiving_and_rushing")
-                if kind == "R"
-                else doc("table#receiving_and_rushing_playoffs")
+        suffix = "" if kind == "R" else "_playoffs"
+        # the table is named for whichever of the two the player did more of
+        table = pq(
+            EITHER_TABLE_XPATH(
+                doc[0],
+                first_id=f"rushing_and_receiving{suffix}",
+                second_id=f"receiving_and_rushing{suffix}",
             )
+        )
         df = sportsref.utils.parse_table(table)
         return df
 
@@ -243,7 +279,7 @@ class Player(object, metaclass=sportsref.decorators.Cached):
         :returns: Pandas DataFrame with rushing/receiving stats.
         """
         doc = self.get_doc()
-        table = doc("table#defense") if kind == "R" else doc("table#defense_playoffs")
+        table = _get_table(doc, "defense" if kind == "R" else "defense_playoffs")
         df = sportsref.utils.parse_table(table)
         return df
 
@@ -258,9 +294,8 @@ class Player(object, metaclass=sportsref.decorators.Cached):
         :returns: A DataFrame of plays, each row is a play. Returns None if
         there were no such plays in that year.
         """
-        url = self._subpage_url("{}-plays".format(play_type), year)
-        doc = pq(sportsref.utils.get_html(url))
-        table = doc("table#all_plays")
+        doc = self.get_subpage_doc("{}-plays".format(play_type), year)
+        table = _get_table(doc, "all_plays")
         if table:
             if expand_details:
                 plays = sportsref.nfl.pbp.expand_details(
@@ -311,9 +346,8 @@ class Player(object, metaclass=sportsref.decorators.Cached):
         :returns: A DataFrame of splits data.
         """
         # get the table
-        url = self._subpage_url("splits", year)
-        doc = pq(sportsref.utils.get_html(url))
-        table = doc("table#stats")
+        doc = self.get_subpage_doc("splits", year)
+        table = _get_table(doc, "stats")
         df = sportsref.utils.parse_table(table)
         # cleaning the data
         if not df.empty:
@@ -330,9 +364,8 @@ class Player(object, metaclass=sportsref.decorators.Cached):
         :returns: A DataFrame of advanced splits data.
         """
         # get the table
-        url = self._subpage_url("splits", year)
-        doc = pq(sportsref.utils.get_html(url))
-        table = doc("table#advanced_splits")
+        doc = self.get_subpage_doc("splits", year)
+        table = _get_table(doc, "advanced_splits")
         df = sportsref.utils.parse_table(table)
         # cleaning the data
         if not df.empty:
@@ -350,7 +383,7 @@ class Player(object, metaclass=sportsref.decorators.Cached):
         """
         doc = self.get_doc()
         table = doc("div#leaderboard_{} table".format(award_id))
-        return list(map(int, sportsref.utils.parse_awards_table(table)))
+        return [int(year) for year in sportsref.utils.parse_awards_table(table)]
 
     def pro_bowls(self):
         """Returns a list of years in which the player made the Pro Bowl."""
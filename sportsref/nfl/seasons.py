@@ -1,5 +1,3 @@
-from pyquery import PyQuery as pq
-
 import sportsref
 
 
@@ -27,15 +25,15 @@ class Season(object, metaclass=sportsref.decorators.Cached):
         return "Season({})".format(self.yr)
 
     def _subpage_url(self, page):
-        return sportsref.nfl.BASE_URL + "/years/{}/{}.htm".format(self.yr, page)
+        return f"{sportsref.nfl.BASE_URL}/years/{self.yr}/{page}.htm"
 
     @sportsref.decorators.memoize
     def get_main_doc(self):
         """Returns PyQuery object for the main season URL.
         :returns: PyQuery object.
         """
-        url = sportsref.nfl.BASE_URL + "/years/{}/".format(self.yr)
-        return pq(sportsref.utils.get_html(url))
+        url = f"{sportsref.nfl.BASE_URL}/years/{self.yr}/"
+        return sportsref.utils.parse_html(sportsref.utils.get_html(url))
 
     @sportsref.decorators.memoize
     def get_sub_doc(self, subpage):
@@ -44,7 +42,7 @@ class Season(object, metaclass=sportsref.decorators.Cached):
         :returns: PyQuery object.
         """
         html = sportsref.utils.get_html(self._subpage_url(subpage))
-        return pq(html)
+        return sportsref.utils.parse_html(html)
 
     @sportsref.decorators.memoize
     def get_team_ids(self):
@@ -1,5 +1,9 @@
+import logging
 import re
+import string
+import weakref
 
+import lxml.etree
 import numpy as np
 import pandas as pd
 from pyquery import PyQuery as pq
@@ -8,6 +12,25 @@ import sportsref
 
 __all__ = ["team_names", "team_ids", "list_teams", "Team"]
 
+logger = logging.getLogger(__name__)
+
+COACH_REGEX = re.compile(r"(\S+?) \((\d+)-(\d+)-(\d+)\)")
+SRS_REGEX = re.compile(r"SRS\s*?:\s*?(\S+)")
+SOS_REGEX = re.compile(r"SOS\s*:\s*(\S+)")
+OFF_SCHEME_REGEX = re.compile(r"Offensive Scheme[:\s]*(.+)\s*", re.I)
+DEF_ALIGNMENT_REGEX = re.compile(r"Defensive Alignment[:\s]*(.+)\s*", re.I)
+
+# p tags in the team-season info box (outside of the logo) containing a
+# keyword, lowercasing with translate() since XPath 1.0 has no lower-case()
+YEAR_INFO_P_XPATH = lxml.etree.XPath(
+    '//div[@id="meta"]//div[not(contains(concat(" ", @class, " "), " logo "))]'
+    f'//p[contains(translate(., "{string.ascii_uppercase}", '
+    f'"{string.ascii_lowercase}"), $keyword)]'
+)
+
+# existing Team objects, keyed by team ID, so that each team has one instance
+team_instances = weakref.WeakValueDictionary()
+
 
 @sportsref.decorators.memoize
 def team_names(year):
@@ -17,7 +40,8 @@ def team_names(year):
     :year: The year of the season in question (as an int).
     :returns: A dictionary with teamID keys and full team name values.
     """
-    doc = pq(sportsref.utils.get_html(sportsref.nfl.BASE_URL + "/teams/"))
+    html = sportsref.utils.get_html(sportsref.nfl.BASE_URL + "/teams/")
+    doc = sportsref.utils.parse_html(html)
     active_table = doc("table#teams_active")
     active_df = sportsref.utils.parse_table(active_table)
     inactive_table = doc("table#teams_inactive")
@@ -25,10 +49,13 @@ def team_names(year):
     df = pd.concat((active_df, inactive_df))
     df = df.loc[~df["has_class_partial_table"]]
     ids = df.team_id.str[:3].values
-    names = [tr("th a") for tr in list(active_table("tr").items())]
-    names.extend(tr("th a") for tr in list(inactive_table("tr").items()))
-    names = [_f for _f in names if _f]
-    names = [lst[0].text_content() for lst in names]
+    # the team name is the first link in each row's header cell
+    anchors = (
+        tr.find(".//th//a")
+        for table in (active_table, inactive_table)
+        for tr in table("tr")
+    )
+    names = [a.text_content() for a in anchors if a is not None]
     # combine IDs and team names into pandas series
     series = pd.Series(names, index=ids)
     # create a mask to filter to teams from the given year
@@ -59,9 +86,16 @@ def list_teams(year):
     return list(team_names(year).keys())
 
 
-class Team(object, metaclass=sportsref.decorators.Cached):
-    def __init__(self, teamID):
-        self.teamID = teamID
+class Team(object):
+    __slots__ = ("teamID", "__weakref__")
+
+    def __new__(cls, teamID):
+        team = team_instances.get(teamID)
+        if team is None:
+            team = super().__new__(cls)
+            team.teamID = teamID
+            team_instances[teamID] = team
+        return team
 
     def __eq__(self, other):
         return self.teamID == other.teamID
@@ -80,18 +114,18 @@ class Team(object, metaclass=sportsref.decorators.Cached):
 
     @sportsref.decorators.memoize
     def team_year_url(self, yr_str):
-        return sportsref.nfl.BASE_URL + "/teams/{}/{}.htm".format(self.teamID, yr_str)
+        return f"{sportsref.nfl.BASE_URL}/teams/{self.teamID}/{yr_str}.htm"
 
     @sportsref.decorators.memoize
     def get_main_doc(self):
-        relURL = "/teams/{}".format(self.teamID)
-        teamURL = sportsref.nfl.BASE_URL + relURL
-        mainDoc = pq(sportsref.utils.get_html(teamURL))
+        teamURL = f"{sportsref.nfl.BASE_URL}/teams/{self.teamID}"
+        mainDoc = sportsref.utils.parse_html(sportsref.utils.get_html(teamURL))
         return mainDoc
 
     @sportsref.decorators.memoize
     def get_year_doc(self, yr_str):
-        return pq(sportsref.utils.get_html(self.team_year_url(yr_str)))
+        html = sportsref.utils.get_html(self.team_year_url(yr_str))
+        return sportsref.utils.parse_html(html)
 
     @sportsref.decorators.memoize
     def name(self):
@@ -159,20 +193,15 @@ class Team(object, metaclass=sportsref.decorators.Cached):
         :keyword: A keyword to filter to a single p tag in the meta div.
         :returns: A PyQuery object for the selected p element.
         """
-        doc = self.get_year_doc(year)
-        p_tags = doc("div#meta div:not(.logo) p")
-        texts = [p_tag.text_content().strip() for p_tag in p_tags]
-        try:
-            return next(
-                pq(p_tag)
-                for p_tag, text in zip(p_tags, texts)
-                if keyword.lower() in text.lower()
-            )
-        except StopIteration:
-            if len(texts):
-                raise ValueError("Keyword not found in any p tag.")
-            else:
-                raise ValueError("No meta div p tags found.")
+        root = self.get_year_doc(year)[0]
+        p_tags = YEAR_INFO_P_XPATH(root, keyword=keyword.lower())
+        if p_tags:
+            return pq(p_tags[0])
+        # every p tag contains the empty string
+        elif YEAR_INFO_P_XPATH(root, keyword=""):
+            raise ValueError("Keyword not found in any p tag.")
+        else:
+            raise ValueError("No meta div p tags found.")
 
     # TODO: add functions for OC, DC, PF, PA, W-L, etc.
     # TODO: Also give a function at BoxScore.homeCoach and BoxScore.awayCoach
@@ -188,11 +217,10 @@ class Team(object, metaclass=sportsref.decorators.Cached):
         game in the season.
         """
         coach_str = self._year_info_pq(year, "Coach").text()
-        regex = r"(\S+?) \((\d+)-(\d+)-(\d+)\)"
         coachAndTenure = []
         m = True
         while m:
-            m = re.search(regex, coach_str)
+            m = COACH_REGEX.search(coach_str)
             coachID, wins, losses, ties = m.groups()
             # nextIndex = m.end(4) + 1
             # coachStr = coachStr[nextIndex:]
@@ -245,11 +273,13 @@ class Team(object, metaclass=sportsref.decorators.Cached):
         try:
             srs_text = self._year_info_pq(year, "SRS").text()
         except ValueError:
+            logger.warning("no SRS found for %s in %s", self.teamID, year)
             return None
-        m = re.match(r"SRS\s*?:\s*?(\S+)", srs_text)
+        m = SRS_REGEX.match(srs_text)
         if m:
             return float(m.group(1))
         else:
+            logger.warning("could not parse SRS for %s in %s", self.teamID, year)
             return None
 
     @sportsref.decorators.memoize
@@ -263,11 +293,13 @@ class Team(object, metaclass=sportsref.decorators.Cached):
         try:
             sos_text = self._year_info_pq(year, "SOS").text()
         except ValueError:
+            logger.warning("no SOS found for %s in %s", self.teamID, year)
             return None
-        m = re.search(r"SOS\s*:\s*(\S+)", sos_text)
+        m = SOS_REGEX.search(sos_text)
         if m:
             return float(m.group(1))
         else:
+            logger.warning("could not parse SOS for %s in %s", self.teamID, year)
             return None
 
     @sportsref.decorators.memoize
@@ -318,7 +350,7 @@ class Team(object, metaclass=sportsref.decorators.Cached):
         :returns: A string representing the offensive scheme.
         """
         scheme_text = self._year_info_pq(year, "Offensive Scheme").text()
-        m = re.search(r"Offensive Scheme[:\s]*(.+)\s*", scheme_text, re.I)
+        m = OFF_SCHEME_REGEX.search(scheme_text)
         if m:
             return m.group(1)
         else:
@@ -333,7 +365,7 @@ class Team(object, metaclass=sportsref.decorators.Cached):
         :returns: A string representing the defensive alignment.
         """
         scheme_text = self._year_info_pq(year, "Defensive Alignment").text()
-        m = re.search(r"Defensive Alignment[:\s]*(.+)\s*", scheme_text, re.I)
+        m = DEF_ALIGNMENT_REGEX.search(scheme_text)
         if m:
             return m.group(1)
         else:
@@ -1,3 +1,7 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
 OPTIONS = {"cache": True, "memoize": True}
 
 
@@ -6,8 +10,7 @@ def get_option(option):
     if option in OPTIONS:
         return OPTIONS[option]
     else:
-        # TODO: log
-        print(f"option {option} not recognized")
+        logger.warning("option %s not recognized", option)
         return None
 
 
@@ -16,5 +19,4 @@ def set_option(option, value):
     if option in OPTIONS:
         OPTIONS[option] = value
     else:
-        # TODO: log
-        print("option {option} not recognized")
+        logger.warning("option %s not recognized", option)
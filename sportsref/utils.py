@@ -1,18 +1,87 @@
+import concurrent.futures
 import ctypes
+import email.utils
+import functools
+import logging
 import multiprocessing
 import re
 import threading
 import time
 
+import lxml.html
 import pandas as pd
 import requests
+import requests.adapters
 from pyquery import PyQuery as pq
 
 import sportsref
 
+logger = logging.getLogger(__name__)
+
 # time between requests, in seconds
 THROTTLE_DELAY = 0.5
 
+# matches the HTML comment markers that hide many of the tables on the page
+COMMENT_REGEX = re.compile(r"<!--|-->")
+
+# matches *, +, and other characters used to note things in table cells
+NOTE_CHARS_REGEX = re.compile(r"[\*\+\u2605]", re.U)
+
+# used by parse_table to convert percentages and salaries to floats
+PERCENT_REGEX = re.compile(r"([-\.\d]+)\%", re.U)
+SALARY_REGEX = re.compile(r"\$[\d,]+", re.U)
+SALARY_CHARS_REGEX = re.compile(r"\$|,")
+
+# used by parse_table to split date_game links and minutes played into parts
+DATE_GAME_REGEX = re.compile(
+    r"month=(?P<month>\d+)&day=(?P<day>\d+)&year=(?P<year>\d+)"
+)
+MINUTES_PLAYED_REGEX = re.compile(r"(?P<m>\d+):(?P<s>\d+)")
+
+# used by parse_info_table to turn the row headers into keys
+NON_WORD_REGEX = re.compile(r"\W")
+
+# patterns that rel_url_to_id tries in order to pull the ID out of a URL
+REL_URL_REGEXES = tuple(
+    re.compile(regex, re.I)
+    for regex in (
+        r".*/years/(\d{4}).*|.*/gamelog/(\d{4}).*",  # year
+        r".*/players/(?:\w/)?(.+?)(?:/|\.html?)",  # player
+        r".*/boxscores/(.+?)\.html?",  # boxscores
+        r".*/teams/(\w{3})/.*",  # team
+        r".*/coaches/(.+?)\.html?",  # coach
+        r".*/stadiums/(.+?)\.html?",  # stadium
+        r".*/officials/(.+?r)\.html?",  # ref
+        r".*/schools/(\S+?)/.*|.*college=([^&]+)",  # college
+        r".*/schools/high_schools\.cgi\?id=([^\&]{8})",  # high school
+        r".*/boxscores/index\.f?cgi\?(month=\d+&day=\d+&year=\d+)",  # bs date
+        r".*/leagues/(.*_\d{4}).*",  # league
+        r".*/awards/(.+)\.htm",  # award
+    )
+)
+
+# table columns that parse_table leaves out of its DataFrames
+SKIP_COLUMNS = frozenset(("ranker", "Xxx", "Yyy", "Zzz"))
+
+# per-thread HTML parsers, reused across pages (lxml parsers aren't thread-safe)
+html_parsers = threading.local()
+
+# session shared by all requests, so connections to the sites are reused
+session = requests.Session()
+http_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    # retry dropped connections and transient server errors on the open pool
+    max_retries=requests.adapters.Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,
+    ),
+)
+session.mount("http://", http_adapter)
+session.mount("https://", http_adapter)
+
 # variables used to throttle requests across processes
 throttle_thread_lock = threading.Lock()
 throttle_process_lock = multiprocessing.Lock()
@@ -22,37 +91,99 @@ last_request_time = multiprocessing.Value(
 
 
 @sportsref.decorators.cache
-def get_html(url):
+def get_html(url, modified_since=None):
     """Gets the HTML for the given URL using a GET request.
 
     :url: the absolute URL of the desired page.
-    :returns: a string of HTML.
+    :modified_since: if given, a timestamp of a cached copy of the page; makes
+        the request conditional on the page having changed since then.
+    :returns: a string of HTML, or None if the page hasn't been modified since
+        `modified_since`.
     """
     global last_request_time
     with throttle_process_lock:
         with throttle_thread_lock:
-            # sleep until THROTTLE_DELAY secs have passed since last request
-            wait_left = THROTTLE_DELAY - (time.time() - last_request_time.value)
-            if wait_left > 0:
-                time.sleep(wait_left)
-
-            # make request
-            response = requests.get(url)
+            # reserve a time slot THROTTLE_DELAY secs after the last request
+            request_time = max(time.time(), last_request_time.value + THROTTLE_DELAY)
+            last_request_time.value = request_time
+
+    # sleep until our slot comes up, then make the request outside of the
+    # locks so that concurrent requests can overlap their round trips
+    wait_left = request_time - time.time()
+    if wait_left > 0:
+        time.sleep(wait_left)
+
+    # make request
+    headers = {}
+    if modified_since is not None:
+        headers["If-Modified-Since"] = email.utils.formatdate(
+            modified_since, usegmt=True
+        )
+    response = session.get(url, headers=headers)
 
-            # update last request time for throttling
-            last_request_time.value = time.time()
+    # the cached copy is still current, so skip downloading it again
+    if response.status_code == 304:
+        return None
 
     # raise ValueError on 4xx status code, get rid of comments, and return
     if 400 <= response.status_code < 500:
         raise ValueError(
             f'Status Code {response.status_code} received fetching URL "{url}"'
         )
-    html = response.text
-    html = html.replace("<!--", "").replace("-->", "")
+    # strip comment markers in one pass to avoid an extra copy of the page
+    html = COMMENT_REGEX.sub("", response.text)
 
     return html
 
 
+def parse_html(html):
+    """Parses an HTML page into a PyQuery object. Uses lxml's HTML parser
+    directly (rather than letting PyQuery try parsing the page as XML first)
+    and reuses one parser per thread.
+
+    :html: the HTML of the page, as returned by get_html.
+    :returns: PyQuery object representing the page.
+    """
+    parser = getattr(html_parsers, "parser", None)
+    if parser is None:
+        parser = html_parsers.parser = lxml.html.HTMLParser(recover=True)
+    return pq(lxml.html.fromstring(html, parser=parser))
+
+
+def thread_map(func, iterable, max_workers=8):
+    """Applies a function to each item of an iterable using a pool of
+    threads, which is useful for fanning out I/O-bound work like fetching many
+    pages. Requests made through get_html are still throttled.
+
+    :func: the function to apply to each item.
+    :iterable: the items to which the function is applied.
+    :max_workers: the maximum number of threads to use. Defaults to 8.
+    :returns: a list of the results, in the same order as the items.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, iterable))
+
+
+def prefetch_docs(objs, doc_getter, max_workers=16):
+    """Fetches the pages of many objects concurrently by calling each unique
+    object's memoized doc getter, so that later calls are served from the
+    memoized docs. Pages that can't be fetched are skipped.
+
+    :objs: the objects whose pages are fetched.
+    :doc_getter: the name of the objects' doc getter method, e.g. "get_doc".
+    :max_workers: the maximum number of threads to use. Defaults to 16.
+    :returns: None
+    """
+
+    def fetch(obj):
+        try:
+            getattr(obj, doc_getter)()
+        except ValueError:
+            pass
+
+    thread_map(fetch, list(dict.fromkeys(objs)), max_workers)
+
+
 def parse_table(table, flatten=True, footer=False):
     """Parses a table from sports-reference sites into a pandas dataframe.
 
@@ -73,31 +204,51 @@ def parse_table(table, flatten=True, footer=False):
 
     # get data
     rows = list(
-        table("tbody tr" if not footer else "tfoot tr")
-        .not_(".thead, .stat_total, .stat_average")
-        .items()
+        table("tbody tr" if not footer else "tfoot tr").not_(
+            ".thead, .stat_total, .stat_average"
+        )
     )
-    data = [
-        [flatten_links(td) if flatten else td.text() for td in row.items("th,td")]
-        for row in rows
-    ]
+    # skip the cells of columns that are dropped anyway instead of parsing them
+    keep_cols = [col not in SKIP_COLUMNS for col in columns]
+    if flatten:
+        data = [
+            [
+                flatten_links(pq(td))
+                for td, keep in zip(row.iter("th", "td"), keep_cols)
+                if keep
+            ]
+            for row in rows
+        ]
+    else:
+        # plain text doesn't need PyQuery, so read it straight from lxml
+        data = [
+            [
+                " ".join(td.text_content().split())
+                for td, keep in zip(row.iter("th", "td"), keep_cols)
+                if keep
+            ]
+            for row in rows
+        ]
 
     # make DataFrame
+    columns = [col for col, keep in zip(columns, keep_cols) if keep]
     df = pd.DataFrame(data, columns=columns, dtype="float")
 
-    # add has_class columns
-    all_classes = set(
-        cls for row in rows if row.attr["class"] for cls in row.attr["class"].split()
-    )
-    for cls in all_classes:
-        df["has_class_" + cls] = [
-            bool(row.attr["class"] and cls in row.attr["class"].split()) for row in rows
-        ]
+    # add has_class columns, all in one operation
+    row_classes = [set(row.get("class", "").split()) for row in rows]
+    all_classes = set().union(*row_classes)
+    if all_classes:
+        class_df = pd.DataFrame(
+            {
+                "has_class_" + cls: [cls in classes for classes in row_classes]
+                for cls in all_classes
+            },
+            index=df.index,
+        )
+        df = pd.concat((df, class_df), axis=1)
 
     # cleaning the DataFrame
 
-    df.drop(["ranker", "Xxx", "Yyy", "Zzz"], axis=1, inplace=True, errors="ignore")
-
     # year_id -> year (as int)
     if "year_id" in df.columns:
         df.rename(columns={"year_id": "year"}, inplace=True)
@@ -115,11 +266,11 @@ def parse_table(table, flatten=True, footer=False):
             df.rename(columns={bs_id_col: "boxscore_id"}, inplace=True)
             break
 
-    # ignore *, +, and other characters used to note things
-    df.replace(re.compile(r"[\*\+\u2605]", re.U), "", inplace=True)
+    # ignore *, +, and other characters used to note things (one vectorized
+    # pass per string column)
     for col in df.columns:
         if hasattr(df[col], "str"):
-            df[col] = df[col].str.strip()
+            df[col] = df[col].str.replace(NOTE_CHARS_REGEX, "", regex=True).str.strip()
 
     # player -> player_id and/or player_name
     if "player" in df.columns:
@@ -145,8 +296,7 @@ def parse_table(table, flatten=True, footer=False):
 
     # handle date_game columns (different types)
     if "date_game" in df.columns and flatten:
-        date_re = r"month=(?P<month>\d+)&day=(?P<day>\d+)&year=(?P<year>\d+)"
-        date_df = df["date_game"].str.extract(date_re, expand=True)
+        date_df = df["date_game"].str.extract(DATE_GAME_REGEX, expand=True)
         if date_df.notnull().all(axis=1).any():
             df = pd.concat((df, date_df), axis=1)
         else:
@@ -159,9 +309,7 @@ def parse_table(table, flatten=True, footer=False):
 
     # mp: (min:sec) -> float(min + sec / 60), notes -> NaN, new column
     if "mp" in df.columns and df.dtypes["mp"] == object and flatten:
-        mp_df = (
-            df["mp"].str.extract(r"(?P<m>\d+):(?P<s>\d+)", expand=True).astype(float)
-        )
+        mp_df = df["mp"].str.extract(MINUTES_PLAYED_REGEX, expand=True).astype(float)
         no_match = mp_df.isnull().all(axis=1)
         if no_match.any():
             df.loc[no_match, "note"] = df.loc[no_match, "mp"]
@@ -170,7 +318,7 @@ def parse_table(table, flatten=True, footer=False):
     # converts number-y things to floats
     def convert_to_float(val):
         # percentages: (number%) -> float(number * 0.01)
-        m = re.search(r"([-\.\d]+)\%", val if isinstance(val, str) else str(val), re.U)
+        m = PERCENT_REGEX.search(val if isinstance(val, str) else str(val))
         try:
             if m:
                 return float(m.group(1)) / 100 if m else val
@@ -179,10 +327,10 @@ def parse_table(table, flatten=True, footer=False):
         except ValueError:
             return val
         # salaries: $ABC,DEF,GHI -> float(ABCDEFGHI)
-        m = re.search(r"\$[\d,]+", val if isinstance(val, str) else str(val), re.U)
+        m = SALARY_REGEX.search(val if isinstance(val, str) else str(val))
         try:
             if m:
-                return float(re.sub(r"\$|,", "", val))
+                return float(SALARY_CHARS_REGEX.sub("", val))
         except Exception:
             return val
         # generally try to coerce to float, unless it's an int or bool
@@ -211,11 +359,11 @@ def parse_info_table(table):
     :returns: A dictionary representing the information.
     """
     ret = {}
-    for tr in list(table("tr").not_(".thead").items()):
-        th, td = list(tr("th, td").items())
-        key = th.text().lower()
-        key = re.sub(r"\W", "_", key)
-        val = sportsref.utils.flatten_links(td)
+    for tr in table("tr").not_(".thead"):
+        th, td = tr.iter("th", "td")
+        key = " ".join(th.text_content().split()).lower()
+        key = NON_WORD_REGEX.sub("_", key)
+        val = flatten_links(pq(td))
         ret[key] = val
     return ret
 
@@ -226,7 +374,7 @@ def parse_awards_table(table):
     :table: PyQuery object representing the HTML table.
     :returns: A list of the entries in the table, with flattened links.
     """
-    return [flatten_links(tr) for tr in list(table("tr").items())]
+    return [flatten_links(tr) for tr in table("tr").items()]
 
 
 def flatten_links(td, _recurse=False):
@@ -247,15 +395,18 @@ def flatten_links(td, _recurse=False):
         else:
             return flatten_links(pq(c), _recurse=True)
 
-    # if there's no text, just return None
-    if td is None or not td.text():
+    # if there's no text, just return None (lxml's text_content is much cheaper
+    # than PyQuery's text() for this check)
+    if td is None or not "".join(el.text_content() for el in td).strip():
         return "" if _recurse else None
 
     td.remove("span.note")
     return "".join(_flatten_node(c) for c in td.contents())
 
 
-@sportsref.decorators.memoize
+# pure function of the URL that's called for every link in every table, so it
+# uses functools' C-level cache instead of memoize's copying wrapper
+@functools.lru_cache(maxsize=None)
 def rel_url_to_id(url):
     """Converts a relative URL to a unique ID.
 
@@ -278,36 +429,8 @@ def rel_url_to_id(url):
 
     :returns: ID associated with the given relative URL.
     """
-    year_regex = r".*/years/(\d{4}).*|.*/gamelog/(\d{4}).*"
-    player_regex = r".*/players/(?:\w/)?(.+?)(?:/|\.html?)"
-    boxscores_regex = r".*/boxscores/(.+?)\.html?"
-    team_regex = r".*/teams/(\w{3})/.*"
-    coach_regex = r".*/coaches/(.+?)\.html?"
-    stadium_regex = r".*/stadiums/(.+?)\.html?"
-    ref_regex = r".*/officials/(.+?r)\.html?"
-    college_regex = r".*/schools/(\S+?)/.*|.*college=([^&]+)"
-    hs_regex = r".*/schools/high_schools\.cgi\?id=([^\&]{8})"
-    bs_date_regex = r".*/boxscores/index\.f?cgi\?(month=\d+&day=\d+&year=\d+)"
-    league_regex = r".*/leagues/(.*_\d{4}).*"
-    award_regex = r".*/awards/(.+)\.htm"
-
-    regexes = [
-        year_regex,
-        player_regex,
-        boxscores_regex,
-        team_regex,
-        coach_regex,
-        stadium_regex,
-        ref_regex,
-        college_regex,
-        hs_regex,
-        bs_date_regex,
-        league_regex,
-        award_regex,
-    ]
-
-    for regex in regexes:
-        match = re.match(regex, url, re.I)
+    for regex in REL_URL_REGEXES:
+        match = regex.match(url)
         if match:
             return [_f for _f in match.groups() if _f][0]
 
@@ -315,5 +438,5 @@ def rel_url_to_id(url):
     if any(url.startswith(s) for s in ("/play-index/",)):
         return url
 
-    print(f'WARNING. NO MATCH WAS FOUND FOR "{url}"')
+    logger.warning('no match was found for "%s"', url)
     return url